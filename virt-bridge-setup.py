@@ -13,41 +13,108 @@ import uuid
 import logging
 import socket
 import struct
-import readline
 import cmd
-from typing import Any, Dict, List, Optional
+import bisect
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple
 import dbus  # type: ignore
 
-# Device types mapping
-DEV_TYPES: Dict[int, str] = {
-    0: "Unknown", 1: "Ethernet", 2: "Wi-Fi", 3: "WWAN", 4: "OLPC Mesh",
-    5: "Bridge", 6: "Bluetooth", 7: "WiMAX", 8: "Modem", 9: "TUN",
-    10: "InfiniBand", 11: "Bond", 12: "VLAN", 13: "ADSL", 14: "Team",
-    15: "Generic", 16: "Veth", 17: "MACVLAN", 18: "OVS Port",
-    19: "OVS Interface", 20: "Dummy", 21: "MACsec", 22: "IPVLAN",
-    23: "OVS Bridge", 24: "IP Tunnel", 25: "Loopback", 26: "6LoWPAN",
-    27: "HSR", 28: "Wi-Fi P2P", 29: "VRF", 30: "WireGuard",
-    31: "WPAN", 32: "VPRP",
-}
-
-# Device states mapping
-DEV_STATES: Dict[int, str] = {
-    10: "Unmanaged", 20: "Unavailable", 30: "Disconnected", 40: "Prepare",
-    50: "Config", 60: "Need Auth", 70: "IP Config", 80: "IP Check",
-    90: "Secondaries", 100: "Activated", 110: "Deactivating", 120: "Failed",
-}
+# Device types, indexed by NMDeviceType
+DEV_TYPES: Tuple[str, ...] = (
+    "Unknown", "Ethernet", "Wi-Fi", "WWAN", "OLPC Mesh",                 # 0-4
+    "Bridge", "Bluetooth", "WiMAX", "Modem", "TUN",                      # 5-9
+    "InfiniBand", "Bond", "VLAN", "ADSL", "Team",                        # 10-14
+    "Generic", "Veth", "MACVLAN", "OVS Port",                            # 15-18
+    "OVS Interface", "Dummy", "MACsec", "IPVLAN",                        # 19-22
+    "OVS Bridge", "IP Tunnel", "Loopback", "6LoWPAN",                    # 23-26
+    "HSR", "Wi-Fi P2P", "VRF", "WireGuard",                              # 27-30
+    "WPAN", "VPRP",                                                      # 31-32
+)
+
+# Device states, indexed by NMDeviceState // 10 - 1 (states are 10, 20, ... 120)
+DEV_STATES: Tuple[str, ...] = (
+    "Unmanaged", "Unavailable", "Disconnected", "Prepare",
+    "Config", "Need Auth", "IP Config", "IP Check",
+    "Secondaries", "Activated", "Deactivating", "Failed",
+)
+
+# NetworkManager gives IPv4 addresses as uint32 stored in network byte order
+IPV4_PACK = struct.Struct('<L').pack
+
+# One list_devices row, filled from the dict _collect_device_info returns
+DEV_ROW_FMT = ("{iface:<15} {type:<12} {mac:<20} {state:<15} "
+               "{conn_name:<18} {autoconnect:<12}").format_map
+
+# Interfaces never proposed as a bridge slave
+IGNORED_IFACE_PREFIXES = ('lo', 'virbr', 'vnet', 'docker', 'p2p-dev-')
+
+# NetworkManager objects replaced under a new path whenever a device's IP setup
+# or activation changes, their memoized proxies must not outlive them
+TRANSIENT_PATH_PREFIXES = ('/org/freedesktop/NetworkManager/IP4Config/',
+                           '/org/freedesktop/NetworkManager/ActiveConnection/')
 
 DEFAULT_BRIDGE_CONN_NAME = 'c-mybr0'
 DEFAULT_BRIDGE_IFNAME = 'mybr0'
 
+@dataclass
+class SlaveInterfaces:
+    """
+    Interfaces that can be enslaved to a bridge, by category.
+    """
+    categories: Dict[str, List[str]] = field(default_factory=lambda: {
+        'eth_with_ip': [], 'eth_without_ip': [],
+        'wifi_with_ip': [], 'wifi_without_ip': []
+    })
+
+    @property
+    def candidates(self) -> List[str]:
+        """ All interfaces, sorted by name """
+        return sorted(iface for ifaces in self.categories.values() for iface in ifaces)
+
 class NMManager:
     """
     A class to manage NetworkManager via D-Bus.
     """
+    # one system bus connection is shared by all instances
+    _shared_bus: Optional[dbus.SystemBus] = None
+
+    @classmethod
+    def _get_shared_bus(cls) -> dbus.SystemBus:
+        """ Connects to the system bus on first use """
+        if cls._shared_bus is None:
+            # async D-Bus calls need a main loop to receive their replies,
+            # GObject is only loaded once a bus is actually needed
+            from dbus.mainloop.glib import DBusGMainLoop  # pylint: disable=import-outside-toplevel
+            DBusGMainLoop(set_as_default=True)
+            cls._shared_bus = dbus.SystemBus()
+        return cls._shared_bus
+
+    @classmethod
+    def oneshot(cls) -> 'NMManager':
+        """
+        Returns a manager on its own private bus connection, for one-shot commands.
+        It registers no signal receivers, so it costs no AddMatch round trips and
+        its caches are only invalidated by its own changes. Call close() when done.
+        """
+        from dbus.mainloop.glib import DBusGMainLoop  # pylint: disable=import-outside-toplevel
+        try:
+            DBusGMainLoop(set_as_default=True)
+            bus = dbus.bus.BusConnection(dbus.bus.BusConnection.TYPE_SYSTEM)
+        except dbus.exceptions.DBusException as err:
+            logging.error("Error connecting to D-Bus: %s", err)
+            sys.exit(1)
+        return cls(bus)
 
-    def __init__(self) -> None:
+    def __init__(self, bus: Optional[dbus.bus.BusConnection] = None) -> None:
         try:
-            self.bus: dbus.SystemBus = dbus.SystemBus()
+            self.bus: dbus.bus.BusConnection = bus or self._get_shared_bus()
+            self._proxy_cache: Dict[str, dbus.proxies.ProxyObject] = {}
+            self._iface_cache: Dict[Tuple[str, str], dbus.proxies.Interface] = {}
+            # ask the bus daemon, instead of letting get_object try to D-Bus activate NM
+            if not self.bus.name_has_owner('org.freedesktop.NetworkManager'):
+                logging.error("NetworkManager is not running.")
+                sys.exit(1)
             self.nm_proxy: dbus.proxies = self.bus.get_object(
                 'org.freedesktop.NetworkManager',
                 '/org/freedesktop/NetworkManager'
@@ -68,60 +135,292 @@ class NMManager:
                 self.settings_proxy,
                 'org.freedesktop.NetworkManager.Settings'
             )
+            self.om_interface: dbus.proxies.Interface = self._get_interface(
+                '/org/freedesktop',
+                'org.freedesktop.DBus.ObjectManager'
+            )
+            # connection settings and device paths are cached until NM signals a change,
+            # or for one-shot managers until they change something themselves
+            self._conn_cache: Optional[Dict[str, Dict[str, Any]]] = None
+            self._by_key: Dict[str, str] = {}
+            self._ids_cache: Optional[List[str]] = None
+            self._devs_cache: Optional[List[str]] = None
+            self._dev_by_iface: Dict[str, str] = {}
+            self._slaves_cache: Optional[SlaveInterfaces] = None
+            # live IPv4 config per interface name, and the device path it was read from
+            self._live_cfg_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+            self._live_cfg_paths: Dict[str, str] = {}
+            # each receiver costs a blocking AddMatch: only the long-lived shared-bus
+            # manager needs them, one-shot managers invalidate after their own changes
+            if bus is None:
+                self._add_signal_receivers()
         except dbus.exceptions.DBusException as err:
             logging.error("Error connecting to D-Bus: %s", err)
             logging.error("Please ensure NetworkManager is running.")
             sys.exit(1)
 
-    def select_default_slave_interface(self) -> Optional[str]:
+    def _add_signal_receivers(self) -> None:
+        """ Keeps the caches in sync with NetworkManager for the lifetime of the manager """
+        for signal_name, interface in [
+                ('NewConnection', 'org.freedesktop.NetworkManager.Settings'),
+                ('Removed', 'org.freedesktop.NetworkManager.Settings.Connection'),
+                ('Updated', 'org.freedesktop.NetworkManager.Settings.Connection'),
+            ]:
+            self.bus.add_signal_receiver(self._invalidate_connections,
+                                         signal_name=signal_name,
+                                         dbus_interface=interface)
+        for signal_name in ['DeviceAdded', 'DeviceRemoved']:
+            self.bus.add_signal_receiver(self._invalidate_devices,
+                                         signal_name=signal_name,
+                                         dbus_interface='org.freedesktop.NetworkManager')
+        # memoized proxies of objects that went away are useless
+        for signal_name, interface in [
+                ('DeviceRemoved', 'org.freedesktop.NetworkManager'),
+                ('ConnectionRemoved', 'org.freedesktop.NetworkManager.Settings'),
+            ]:
+            self.bus.add_signal_receiver(self._forget_object,
+                                         signal_name=signal_name,
+                                         dbus_interface=interface)
+        for interface in ['org.freedesktop.NetworkManager.Device',
+                          'org.freedesktop.NetworkManager.IP4Config']:
+            self.bus.add_signal_receiver(self._on_properties_changed,
+                                         signal_name='PropertiesChanged',
+                                         dbus_interface='org.freedesktop.DBus.Properties',
+                                         arg0=interface,
+                                         path_keyword='path')
+
+    def close(self) -> None:
+        """ Closes the bus connection if it is private to this manager """
+        if self.bus is not self._shared_bus:
+            self.bus.close()
+
+    def _get_interface(self, path: str, interface: str) -> dbus.proxies.Interface:
+        """ Returns a memoized D-Bus interface for a NetworkManager object path """
+        key = (path, interface)
+        if key not in self._iface_cache:
+            if path not in self._proxy_cache:
+                self._proxy_cache[path] = self.bus.get_object(
+                    'org.freedesktop.NetworkManager',
+                    path
+                )
+            self._iface_cache[key] = dbus.Interface(self._proxy_cache[path], interface)
+        return self._iface_cache[key]
+
+    def _get_props_iface(self, path: str) -> dbus.proxies.Interface:
+        """ Returns the memoized Properties interface of a NetworkManager object """
+        return self._get_interface(path, 'org.freedesktop.DBus.Properties')
+
+    def _forget_object(self, path: str) -> None:
+        """ Drops the memoized proxy and interfaces of an object """
+        self._proxy_cache.pop(path, None)
+        for key in [key for key in self._iface_cache if key[0] == path]:
+            del self._iface_cache[key]
+
+    def _forget_transient_objects(self) -> None:
+        """ Drops the memoized proxies of IP4Config and ActiveConnection objects """
+        for path in [path for path in self._proxy_cache
+                     if path.startswith(TRANSIENT_PATH_PREFIXES)]:
+            self._forget_object(path)
+
+    def _get_managed_objects(self) -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
         """
-        Selects a default slave interface, prioritizing active devices with IP addresses.
+        Returns the properties of every NetworkManager object in one call,
+        or None if this NetworkManager does not export an ObjectManager.
         """
-        interface_lists: Dict[str, List[str]] = {
-            'eth_with_ip': [], 'eth_without_ip': [],
-            'wifi_with_ip': [], 'wifi_without_ip': []
-        }
+        try:
+            return self.om_interface.GetManagedObjects()
+        except dbus.exceptions.DBusException as err:
+            logging.debug("GetManagedObjects not available: %s", err)
+            return None
 
+    def _get_all_props(self, path: str, interface: str,
+                       objects: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+                       ) -> Dict[str, Any]:
+        """ Returns all properties of an object, from the managed objects snapshot if possible """
+        if objects is not None and interface in objects.get(path, {}):
+            return objects[path][interface]
         try:
-            devices_paths = self.nm_interface.GetAllDevices()
-            if not devices_paths:
-                logging.warning("No network devices found.")
-                return None
-            for dev_path in devices_paths:
-                dev_proxy = self.bus.get_object('org.freedesktop.NetworkManager', dev_path)
-                prop_interface = dbus.Interface(dev_proxy, 'org.freedesktop.DBus.Properties')
-                all_props = prop_interface.GetAll('org.freedesktop.NetworkManager.Device')
-
-                iface = all_props['Interface']
-                dev_type = all_props['DeviceType']
-
-                if iface == 'lo' or dev_type == 5 or any(
-                        iface.startswith(p) for p in ['virbr', 'vnet', 'docker', 'p2p-dev-']):
-                    continue
-
-                ip4_config_path = all_props['Ip4Config']
-                has_ip = False
-                if ip4_config_path != "/":
-                    ip4_config_proxy = self.bus.get_object(
-                            'org.freedesktop.NetworkManager', ip4_config_path)
-                    ip4_props_iface = dbus.Interface(
-                            ip4_config_proxy, 'org.freedesktop.DBus.Properties')
-                    if ip4_props_iface.GetAll(
-                            'org.freedesktop.NetworkManager.IP4Config').get('Addresses'):
-                        has_ip = True
-
-                if dev_type == 1:  # Ethernet
-                    interface_lists['eth_with_ip' if has_ip else 'eth_without_ip'].append(iface)
-                elif dev_type == 2:  # Wi-Fi
-                    interface_lists['wifi_with_ip' if has_ip else 'wifi_without_ip'].append(iface)
+            return self._get_props_iface(path).GetAll(interface)
+        except dbus.exceptions.DBusException:
+            self._forget_object(path)
+            raise
+
+    def _invalidate_connections(self, *_args: Any) -> None:
+        """ Signal handler: saved connections changed """
+        logging.debug("_invalidate_connections")
+        self._conn_cache = None
+        self._by_key = {}
+        self._ids_cache = None
+
+    def _invalidate_devices(self, *_args: Any) -> None:
+        """ Signal handler: a device appeared or disappeared """
+        logging.debug("_invalidate_devices")
+        self._devs_cache = None
+        self._dev_by_iface = {}
+        self._slaves_cache = None
+        # the live config is keyed by interface name, which may come back on a new device
+        self._live_cfg_cache.clear()
+        self._live_cfg_paths.clear()
+
+    def _on_properties_changed(self, interface: str, changed: Dict[str, Any],
+                               _invalidated: List[str], path: str = '') -> None:
+        """ Signal handler: drops what was cached about a device whose IP setup changed """
+        if interface == 'org.freedesktop.NetworkManager.IP4Config':
+            # no cheap way back to the device, IP4Config changes are rare
+            self._live_cfg_cache.clear()
+            self._live_cfg_paths.clear()
+            self._slaves_cache = None
+            return
+        if 'Ip4Config' in changed or 'ActiveConnection' in changed:
+            # the device left its old IP4Config/ActiveConnection object behind
+            self._forget_transient_objects()
+        if 'Ip4Config' in changed or 'State' in changed:
+            self._slaves_cache = None
+            iface = self._live_cfg_paths.pop(path, None)
+            if iface is not None:
+                logging.debug("_on_properties_changed: %s", iface)
+                self._live_cfg_cache.pop(iface, None)
+
+    def _process_signals(self) -> None:
+        """ Dispatches the D-Bus signals received since the last call, without blocking """
+        from gi.repository import GLib  # pylint: disable=import-outside-toplevel
+        context = GLib.MainContext.default()
+        while context.pending():
+            context.iteration(False)
+
+    def _batch_call(self, calls: List[Tuple[Callable[..., Any], Tuple[Any, ...]]],
+                    stop: Optional[Callable[[Any], bool]] = None) -> List[Any]:
+        """
+        Sends all D-Bus calls at once and waits for their replies, so N calls cost
+        about one round trip instead of N. A failed call gives None.
+        If stop() returns True for a reply, the remaining replies are not waited for.
+        """
+        results: List[Any] = [None] * len(calls)
+        if not calls:
+            return results
+        from gi.repository import GLib  # pylint: disable=import-outside-toplevel
+        loop = GLib.MainLoop()
+        state = {'pending': len(calls), 'done': False}
+
+        def finish(index: int, value: Any) -> None:
+            if state['done']:
+                return
+            results[index] = value
+            state['pending'] -= 1
+            if state['pending'] == 0 or (value is not None and stop is not None and stop(value)):
+                state['done'] = True
+                loop.quit()
+
+        def make_handlers(index: int) -> Tuple[Callable[..., None], Callable[[Any], None]]:
+            def on_reply(value: Any = None) -> None:
+                finish(index, value)
+
+            def on_error(err: dbus.exceptions.DBusException) -> None:
+                logging.debug("D-Bus call failed: %s", err)
+                finish(index, None)
+            return on_reply, on_error
+
+        for index, (method, args) in enumerate(calls):
+            on_reply, on_error = make_handlers(index)
+            method(*args, reply_handler=on_reply, error_handler=on_error)
+        loop.run()
+        return results
+
+    def _get_all_settings(self) -> Dict[str, Dict[str, Any]]:
+        """ Returns the settings of all saved connections keyed by path, fetched in one batch """
+        self._process_signals()
+        if self._conn_cache is not None:
+            return self._conn_cache
+        connections_paths = self.settings_interface.ListConnections()
+        calls = []
+        for path in connections_paths:
+            settings_connection = self._get_interface(
+                path,
+                'org.freedesktop.NetworkManager.Settings.Connection'
+            )
+            calls.append((settings_connection.GetSettings, ()))
+        results = self._batch_call(calls)
+        self._conn_cache = {path: config for path, config in zip(connections_paths, results)
+                            if config is not None}
+        self._by_key = {}
+        for path, config in self._conn_cache.items():
+            self._by_key.setdefault(config['connection']['id'], path)
+            self._by_key.setdefault(config['connection']['uuid'], path)
+        return self._conn_cache
+
+    def _get_device_paths(self) -> List[str]:
+        """ Returns the object paths of all devices """
+        self._process_signals()
+        if self._devs_cache is None:
+            self._devs_cache = self.nm_interface.GetAllDevices()
+        return self._devs_cache
+
+    def _get_device_by_iface(self, iface: str) -> str:
+        """
+        Returns the object path of the device named iface, remembered until devices change.
+        Raises DBusException (UnknownDevice) if there is none.
+        """
+        self._process_signals()
+        dev_path = self._dev_by_iface.get(iface)
+        if dev_path is None:
+            dev_path = self.nm_interface.GetDeviceByIpIface(iface)
+            self._dev_by_iface[iface] = dev_path
+        return dev_path
+
+    def _enumerate_slave_devices(self) -> SlaveInterfaces:
+        """
+        Sorts all potential slave interfaces by type and IP address in one pass
+        over the devices. The result is kept until the devices change.
+        """
+        self._process_signals()
+        if self._slaves_cache is not None:
+            return self._slaves_cache
+        slaves = SlaveInterfaces()
+        devices_paths = self._get_device_paths()
+        if not devices_paths:
+            logging.warning("No network devices found.")
+            return slaves
+        objects = self._get_managed_objects()
+        for dev_path in devices_paths:
+            all_props = self._get_all_props(dev_path, 'org.freedesktop.NetworkManager.Device',
+                                            objects)
+
+            iface = all_props['Interface']
+            dev_type = all_props['DeviceType']
+
+            # only Ethernet and Wi-Fi can be enslaved, don't look at the IP of others
+            if dev_type not in (1, 2) or iface.startswith(IGNORED_IFACE_PREFIXES):
+                continue
+
+            ip4_config_path = all_props['Ip4Config']
+            has_ip = False
+            if ip4_config_path != "/":
+                if self._get_all_props(ip4_config_path,
+                                       'org.freedesktop.NetworkManager.IP4Config',
+                                       objects).get('Addresses'):
+                    has_ip = True
+
+            if dev_type == 1:  # Ethernet
+                slaves.categories['eth_with_ip' if has_ip else 'eth_without_ip'].append(iface)
+            elif dev_type == 2:  # Wi-Fi
+                slaves.categories['wifi_with_ip' if has_ip else 'wifi_without_ip'].append(iface)
+
+        self._slaves_cache = slaves
+        return slaves
 
+    def select_default_slave_interface(self) -> Optional[str]:
+        """
+        Selects a default slave interface, prioritizing active devices with IP addresses.
+        """
+        try:
+            interface_lists = self._enumerate_slave_devices().categories
         except dbus.exceptions.DBusException as err:
             logging.error("Error while selecting default interface: %s", err)
             return None
 
         for category in ['eth_with_ip', 'wifi_with_ip', 'eth_without_ip', 'wifi_without_ip']:
             if interface_lists[category]:
-                selected_iface = sorted(interface_lists[category])[0]
+                selected_iface = min(interface_lists[category])
                 logging.info("Default slave interface selected: %s (%s)",
                              selected_iface, category.replace('_', ' ').title())
                 return selected_iface
@@ -131,27 +430,10 @@ class NMManager:
 
     def get_slave_candidates(self) -> List[str]:
         """ Returns a list of all potential slave interfaces (Ethernet, Wi-Fi) """
-        candidates: List[str] = []
         try:
-            devices_paths = self.nm_interface.GetAllDevices()
-            for dev_path in devices_paths:
-                dev_proxy = self.bus.get_object('org.freedesktop.NetworkManager', dev_path)
-                prop_interface = dbus.Interface(dev_proxy, 'org.freedesktop.DBus.Properties')
-                all_props = prop_interface.GetAll('org.freedesktop.NetworkManager.Device')
-
-                iface = all_props['Interface']
-                dev_type = all_props['DeviceType']
-
-                ignored_prefixes = ['lo', 'virbr', 'vnet', 'docker', 'p2p-dev-']
-                if dev_type not in [1, 2] or dev_type == 5 or any(
-                                    iface.startswith(p) for p in ignored_prefixes
-                                    ):
-                    continue
-                candidates.append(iface)
+            return self._enumerate_slave_devices().candidates
         except dbus.exceptions.DBusException:
             return []
-        candidates.sort()
-        return candidates
 
     def _extract_bridge_settings(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Extracts bridge-specific settings from a connection configuration."""
@@ -183,18 +465,10 @@ class NMManager:
         Finds all existing NetworkManager connections of type 'bridge'.
         """
         logging.debug("find_existing_bridges")
-        all_connections_config = []
-        connections_paths = self.settings_interface.ListConnections()
-        for path in connections_paths:
-            con_proxy = self.bus.get_object('org.freedesktop.NetworkManager', path)
-            settings_connection = dbus.Interface(
-                con_proxy,
-                'org.freedesktop.NetworkManager.Settings.Connection'
-            )
-            all_connections_config.append(settings_connection.GetSettings())
+        all_connections_config = self._get_all_settings().values()
 
         bridges_by_uuid = {}
-        slaves_by_master_uuid: Dict[str, List[Dict[str, str]]] = {}
+        slaves_by_master_uuid: DefaultDict[str, List[Dict[str, str]]] = defaultdict(list)
 
         for config in all_connections_config:
             conn_settings = config.get('connection', {})
@@ -206,7 +480,8 @@ class NMManager:
                     'id': conn_settings.get('id', 'N/A'),
                     'uuid': conn_uuid,
                     'interface-name': conn_settings.get('interface-name', 'N/A'),
-                    'slaves': [],
+                    # shares the list its slaves are appended to, whatever the order
+                    'slaves': slaves_by_master_uuid[conn_uuid],
                     'ipv4': self._extract_ipv4_config(config),
                     'bridge_settings': self._extract_bridge_settings(config),
                 }
@@ -216,14 +491,8 @@ class NMManager:
                     'iface': conn_settings.get('interface-name', 'Unknown'),
                     'conn_id': conn_settings.get('id', 'Unknown Profile')
                 }
-                if master_uuid not in slaves_by_master_uuid:
-                    slaves_by_master_uuid[master_uuid] = []
                 slaves_by_master_uuid[master_uuid].append(slave_details)
 
-        for suuid, bridge in bridges_by_uuid.items():
-            if suuid in slaves_by_master_uuid:
-                bridge['slaves'] = slaves_by_master_uuid[suuid]
-
         return list(bridges_by_uuid.values())
 
     def show_existing_bridges(self, found_bridges: List[Dict[str, Any]]) -> None:
@@ -232,38 +501,43 @@ class NMManager:
         count = len(found_bridges)
         print(f"--- Found {count} Bridge(s) ---")
         for i, bridge in enumerate(found_bridges):
-            print(f"  Bridge Profile: {bridge['id']}")
-            print(f"  |- Interface:    {bridge['interface-name']}")
-            print(f"  |- UUID:         {bridge['uuid']}")
+            lines = []
+            lines.append(f"  Bridge Profile: {bridge['id']}")
+            lines.append(f"  |- Interface:    {bridge['interface-name']}")
+            lines.append(f"  |- UUID:         {bridge['uuid']}")
             if bridge['slaves']:
-                print("  |- Slave(s):")
+                lines.append("  |- Slave(s):")
                 for slave in bridge['slaves']:
-                    print(f"  |  |- {slave['iface']} (Profile: {slave['conn_id']})")
+                    lines.append(f"  |  |- {slave['iface']} (Profile: {slave['conn_id']})")
             else:
-                print("  |- Slave:       (None)")
+                lines.append("  |- Slave:       (None)")
             b_settings = bridge['bridge_settings']
-            print("  |- Bridge Settings:")
-            print(f"  |  |- STP Enabled:   {b_settings['stp']}")
-            print(f"  |  |- STP Priority:  {b_settings['priority']}")
-            print(f"  |  |- Forward Delay: {b_settings['forward-delay']}")
-            print(f"  |  |- IGMP snooping: {b_settings['multicast-snooping']}")
-            print(f"  |  |- VLAN Filtering: {b_settings['vlan-filtering']}")
+            lines.append("  |- Bridge Settings:")
+            lines.append(f"  |  |- STP Enabled:   {b_settings['stp']}")
+            lines.append(f"  |  |- STP Priority:  {b_settings['priority']}")
+            lines.append(f"  |  |- Forward Delay: {b_settings['forward-delay']}")
+            lines.append(f"  |  |- IGMP snooping: {b_settings['multicast-snooping']}")
+            lines.append(f"  |  |- VLAN Filtering: {b_settings['vlan-filtering']}")
             if b_settings['vlan-filtering'] == "Yes":
-                print(f"  |  |- vlan-default-pvid:    {b_settings['vlan-default-pvid']}")
-            print(f"  |  |- MAC:    {b_settings['mac-address']}")
+                lines.append(f"  |  |- vlan-default-pvid:    {b_settings['vlan-default-pvid']}")
+            lines.append(f"  |  |- MAC:    {b_settings['mac-address']}")
             ipv4 = bridge['ipv4']
             live_config = self._get_active_network_config(bridge['interface-name'])
             if live_config:
                 ipv4.update(live_config)
-            print(f"  |- IPv4 Config:  ({ipv4['method']})")
-            print(f"  |  |- Address: {', '.join(ipv4['addresses']) or '(Not set)'}")
-            print(f"  |  |- Gateway: {ipv4['gateway'] or '(Not set)'}")
-            print(f"  |   - DNS:     {', '.join(ipv4['dns']) or '(Not set)'}")
+            lines.append(f"  |- IPv4 Config:  ({ipv4['method']})")
+            lines.append(f"  |  |- Address: {', '.join(ipv4['addresses']) or '(Not set)'}")
+            lines.append(f"  |  |- Gateway: {ipv4['gateway'] or '(Not set)'}")
+            lines.append(f"  |   - DNS:     {', '.join(ipv4['dns']) or '(Not set)'}")
             if i < count - 1:
-                print("")
+                lines.append("")
+            sys.stdout.write('\n'.join(lines) + '\n')
 
-    def add_bridge_connection(self, config: Dict[str, Any]) -> None:
-        """ Creates a bridge and enslaves a physical interface to it """
+    def add_bridge_connection(self, config: Dict[str, Any]) -> Optional[str]:
+        """
+        Creates a bridge and enslaves a physical interface to it.
+        Returns the path of the new slave profile, None if nothing was added.
+        """
         logging.debug("add_bridge_connection %s", config)
         bridge_conn_name = config['conn_name']
         bridge_ifname = config['bridge_ifname']
@@ -279,11 +553,14 @@ class NMManager:
 
         if not self.check_interface_exist(slave_iface):
             logging.error("Slave interface %s does not exist", slave_iface)
-            return
+            return None
 
         slave_conn_name = f"{bridge_conn_name}-port-{slave_iface}"
-        self.delete_connection(bridge_conn_name, False, dry_run)
-        self.delete_connection(slave_conn_name, False, dry_run)
+        # look both up first: deleting one invalidates the connection cache
+        old_paths = [(name, self.find_connection(name))
+                     for name in (bridge_conn_name, slave_conn_name)]
+        for name, path in old_paths:
+            self._delete_found_connection(name, path, False, dry_run)
 
         bridge_uuid = str(uuid.uuid4())
 
@@ -317,8 +594,9 @@ class NMManager:
             mac_address = self._get_mac_address(slave_iface)
             logging.info("MAC address of %s is %s", slave_iface, mac_address)
             if mac_address:
-                mac_bytes = [int(x, 16) for x in mac_address.split(':')]
-                bridge_settings['bridge']['mac-address'] = dbus.ByteArray(mac_bytes)
+                bridge_settings['bridge']['mac-address'] = dbus.ByteArray(
+                                                    bytes.fromhex(mac_address.replace(':', ''))
+                                                    )
 
         if forward_delay is not None:
             if not 0 <= forward_delay <= 30:
@@ -342,12 +620,13 @@ class NMManager:
             if not dry_run:
                 logging.info("Creating bridge profile %s...", bridge_conn_name)
                 bridge_path = self.settings_interface.AddConnection(bridge_settings)
+                self._invalidate_connections()
                 logging.info("Successfully added bridge profile. Path: %s", bridge_path)
             else:
                 logging.info("DRY-RUN: Successfully added bridge profile")
         except dbus.exceptions.DBusException as err:
             logging.error("Error adding bridge connection profile: %s", err)
-            return
+            return None
 
         slave_settings = {
             'connection': {
@@ -366,17 +645,19 @@ class NMManager:
                         slave_conn_name, slave_iface
                         )
             if not dry_run:
-                self.settings_interface.AddConnection(slave_settings)
+                slave_path = self.settings_interface.AddConnection(slave_settings)
+                self._invalidate_connections()
                 logging.info("Successfully enslaved interface %s to bridge.",
                              slave_iface)
-            else:
-                logging.info("DRY-RUN: Successfully enslaved interface %s to bridge.",
-                             slave_iface)
+                return slave_path
+            logging.info("DRY-RUN: Successfully enslaved interface %s to bridge.",
+                         slave_iface)
         except dbus.exceptions.DBusException as err:
             logging.error("Error adding slave connection profile: %s", err)
             logging.error("Cleaning up bridge profile due to error...")
             self.delete_connection(bridge_conn_name, False, dry_run)
             self.delete_connection(slave_conn_name, False, dry_run)
+        return None
 
     def _get_active_network_config(self, interface_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -385,92 +666,91 @@ class NMManager:
         logging.debug("_get_active_network_config %s", interface_name)
         if not interface_name:
             return None
+        self._process_signals()
+        if interface_name in self._live_cfg_cache:
+            return self._live_cfg_cache[interface_name]
         try:
-            dev_path = self.nm_interface.GetDeviceByIpIface(interface_name)
-            dev_proxy = self.bus.get_object('org.freedesktop.NetworkManager', dev_path)
-            prop_interface = dbus.Interface(dev_proxy, 'org.freedesktop.DBus.Properties')
+            dev_path = self._get_device_by_iface(interface_name)
+            prop_interface = self._get_props_iface(dev_path)
             all_props = prop_interface.GetAll('org.freedesktop.NetworkManager.Device')
+            self._live_cfg_paths[dev_path] = interface_name
             ip4_config_path = all_props['Ip4Config']
             if ip4_config_path == "/":
+                self._live_cfg_cache[interface_name] = None
                 return None
 
-            ip4_config_proxy = self.bus.get_object(
-                                        'org.freedesktop.NetworkManager',
-                                        ip4_config_path
-                                        )
-            ip4_props_iface = dbus.Interface(ip4_config_proxy, 'org.freedesktop.DBus.Properties')
+            ip4_props_iface = self._get_props_iface(ip4_config_path)
             ip4_props = ip4_props_iface.GetAll('org.freedesktop.NetworkManager.IP4Config')
 
-            addresses = []
-            for addr_data in ip4_props.get('Addresses', []):
-                ip_str = socket.inet_ntoa(struct.pack('<L', int(addr_data[0])))
-                prefix = addr_data[1]
-                addresses.append(f"{ip_str}/{prefix}")
-
-            dns = [socket.inet_ntoa(struct.pack(
-                                        '<L', int(d)
-                                        )) for d in ip4_props.get('Nameservers', [])]
+            addresses = [f"{socket.inet_ntoa(IPV4_PACK(int(addr_data[0])))}/{addr_data[1]}"
+                         for addr_data in ip4_props.get('Addresses', [])]
+            dns = [socket.inet_ntoa(IPV4_PACK(int(d))) for d in ip4_props.get('Nameservers', [])]
             gateway = ip4_props.get('Gateway', 0)
 
-            return {
+            live_config = {
                 'addresses': addresses,
                 'gateway': gateway,
                 'dns': dns
             }
+            self._live_cfg_cache[interface_name] = live_config
+            return live_config
         except dbus.exceptions.DBusException:
             return None
 
     def _get_mac_address(self, iface_name: str) -> Optional[str]:
         """ Helper to get the MAC address for a given interface name """
         logging.debug("_get_mac_address %s", iface_name)
-        devices = self.nm_interface.GetAllDevices()
-        for dev_path in devices:
-            dev_proxy = self.bus.get_object('org.freedesktop.NetworkManager', dev_path)
-            prop_interface = dbus.Interface(dev_proxy, 'org.freedesktop.DBus.Properties')
-
-            if prop_interface.Get(
-                'org.freedesktop.NetworkManager.Device',
-                'Interface') == iface_name:
-                mac = prop_interface.Get('org.freedesktop.NetworkManager.Device', 'HwAddress')
-                if mac:
-                    logging.info("Found MAC address for %s: %s", iface_name, mac)
-                    return mac
+        # the kernel has it at hand, only ask NetworkManager if sysfs can't tell
+        try:
+            with open(f"/sys/class/net/{iface_name}/address", encoding='ascii') as sysfs:
+                mac = sysfs.read().strip().upper()
+        except OSError:
+            mac = None
+        if not mac:
+            try:
+                dev_path = self._get_device_by_iface(iface_name)
+                mac = self._get_props_iface(dev_path).Get('org.freedesktop.NetworkManager.Device',
+                                                          'HwAddress')
+            except dbus.exceptions.DBusException as err:
+                logging.debug("No device for %s: %s", iface_name, err)
+        if mac:
+            logging.info("Found MAC address for %s: %s", iface_name, mac)
+            return mac
         logging.warning("Warning: Could not find MAC address for interface %s.", iface_name)
         return None
 
     def find_connection(self, name_or_uuid: str) -> Optional[str]:
         """ Finds a connection by its name (ID) or UUID """
         logging.debug("find_connection %s", name_or_uuid)
-        connections = self.settings_interface.ListConnections()
-        for path in connections:
-            con_proxy = self.bus.get_object('org.freedesktop.NetworkManager', path)
-            settings_connection = dbus.Interface(
-                                        con_proxy,
-                                        'org.freedesktop.NetworkManager.Settings.Connection'
-                                        )
-            config = settings_connection.GetSettings()
-            if name_or_uuid in (config['connection']['id'], config['connection']['uuid']):
-                logging.info("Found connection %s", config['connection']['id'])
-                logging.info("  UUID: %s", config['connection']['uuid'])
-                logging.info("  Path: %s", path)
-                return path
-        return None
+        all_settings = self._get_all_settings()
+        path = self._by_key.get(name_or_uuid)
+        if path:
+            config = all_settings[path]
+            logging.info("Found connection %s", config['connection']['id'])
+            logging.info("  UUID: %s", config['connection']['uuid'])
+            logging.info("  Path: %s", path)
+        return path
 
     def delete_connection(self, name_or_uuid: str, show_list: bool, dry_run: bool = False) -> None:
         """ Deletes a connection """
         logging.debug("delete_connection %s %s", name_or_uuid, show_list)
-        path = self.find_connection(name_or_uuid)
+        self._delete_found_connection(name_or_uuid, self.find_connection(name_or_uuid),
+                                      show_list, dry_run)
+
+    def _delete_found_connection(self, name_or_uuid: str, path: Optional[str],
+                                 show_list: bool, dry_run: bool) -> None:
+        """ Deletes a connection already looked up with find_connection """
         if path:
             if dry_run:
                 logging.info("DRY-RUN: Would delete connection %s.", name_or_uuid)
                 return
             try:
-                con_proxy = self.bus.get_object('org.freedesktop.NetworkManager', path)
-                connection = dbus.Interface(
-                    con_proxy,
+                connection = self._get_interface(
+                    path,
                     'org.freedesktop.NetworkManager.Settings.Connection'
                 )
                 connection.Delete()
+                self._invalidate_connections()
                 logging.info("Successfully deleted connection %s.", name_or_uuid)
             except dbus.exceptions.DBusException as err:
                 logging.error("Error deleting connection: %s", err)
@@ -480,10 +760,12 @@ class NMManager:
                 logging.info("Connection available are:")
                 self.list_connections()
 
-    def activate_connection(self, name_or_uuid: str, dry_run: bool = False) -> None:
-        """ Activates a connection """
-        logging.debug("activate_connection %s", name_or_uuid)
-        conn_path = self.find_connection(name_or_uuid)
+    def activate_connection(self, name_or_uuid: str, dry_run: bool = False,
+                            conn_path: Optional[str] = None) -> None:
+        """ Activates a connection, looked up by name or UUID unless its path is given """
+        logging.debug("activate_connection %s %s", name_or_uuid, conn_path)
+        if conn_path is None:
+            conn_path = self.find_connection(name_or_uuid)
         if not conn_path:
             logging.info("Connection %s not found to activate.", name_or_uuid)
             logging.info("Connection available are:")
@@ -509,27 +791,17 @@ class NMManager:
         )
         active_conn_path_to_deactivate = None
 
+        calls = []
         for path in active_connections:
-            ac_proxy = self.bus.get_object('org.freedesktop.NetworkManager', path)
-            prop_interface = dbus.Interface(ac_proxy, 'org.freedesktop.DBus.Properties')
+            prop_interface = self._get_props_iface(path)
+            calls.append((prop_interface.Get,
+                          ('org.freedesktop.NetworkManager.Connection.Active', 'Id')))
 
-            conn_settings_path = prop_interface.Get(
-                                            'org.freedesktop.NetworkManager.Connection.Active',
-                                            'Connection'
-                                            )
+        def matches(conn_id: str) -> bool:
+            return conn_id == name_or_uuid
 
-            settings_proxy = self.bus.get_object(
-                                    'org.freedesktop.NetworkManager',
-                                    conn_settings_path
-                                    )
-            settings_iface = dbus.Interface(
-                                    settings_proxy,
-                                    'org.freedesktop.NetworkManager.Settings.Connection'
-                                    )
-            settings = settings_iface.GetSettings()
-            conn_id = settings['connection']['id']
-
-            if conn_id == name_or_uuid:
+        for path, conn_id in zip(active_connections, self._batch_call(calls, stop=matches)):
+            if conn_id is not None and matches(conn_id):
                 active_conn_path_to_deactivate = path
                 break
 
@@ -552,15 +824,7 @@ class NMManager:
         """Retrieves details for all saved NetworkManager connections without printing."""
         logging.debug("_get_connections")
         all_connections = []
-        connections_paths = self.settings_interface.ListConnections()
-        for path in connections_paths:
-            con_proxy = self.bus.get_object('org.freedesktop.NetworkManager', path)
-            settings_iface = dbus.Interface(
-                con_proxy,
-                'org.freedesktop.NetworkManager.Settings.Connection'
-            )
-            config = settings_iface.GetSettings()
-
+        for config in self._get_all_settings().values():
             connection_settings = config.get('connection', {})
             conn_details = {
                 'id': connection_settings.get('id', 'N/A'),
@@ -577,45 +841,84 @@ class NMManager:
         """
         logging.debug("list_connections")
         all_connections = self._get_connections()
-        print(f"{'NAME (ID)':<30} {'TYPE':<18} {'INTERFACE':<15} {'UUID'}")
-        print("=" * 105)
+        rows = [f"{'NAME (ID)':<30} {'TYPE':<18} {'INTERFACE':<15} {'UUID'}", "=" * 105]
         for conn in sorted(all_connections, key=lambda c: c['id']):
-            print(f"{conn['id']:<30} "
-                  f"{conn['type']:<18} "
-                  f"{conn['interface-name']:<15} "
-                  f"{conn['uuid']}"
-                  )
+            rows.append(f"{conn['id']:<30} "
+                        f"{conn['type']:<18} "
+                        f"{conn['interface-name']:<15} "
+                        f"{conn['uuid']}"
+                        )
+        print('\n'.join(rows))
 
     def check_interface_exist(self, interface: str) -> bool:
         """Check if an interface exists."""
         logging.debug("check_interface_exist %s", interface)
-        try:
-            devices_paths = self.nm_interface.GetAllDevices()
-            if not devices_paths:
-                logging.error("No network devices found.")
-                return False
-
-            for dev_path in devices_paths:
-                dev_proxy = self.bus.get_object('org.freedesktop.NetworkManager', dev_path)
-                prop_interface = dbus.Interface(dev_proxy, 'org.freedesktop.DBus.Properties')
-                iface = prop_interface.Get('org.freedesktop.NetworkManager.Device', 'Interface')
-                if interface == iface:
-                    return True  # Found it!
-
+        if not interface:
             return False
-
+        try:
+            self._get_device_by_iface(interface)
+            return True
         except dbus.exceptions.DBusException as err:
-            logging.error("Error getting interface: %s", err)
+            if err.get_dbus_name() != 'org.freedesktop.NetworkManager.UnknownDevice':
+                logging.error("Error getting interface: %s", err)
             return False
 
     def get_all_connection_identifiers(self) -> List[str]:
-        """Returns a flat list of all connection IDs and UUIDs for completion."""
-        identifiers: List[str] = []
-        connections = self._get_connections()
-        for conn in connections:
-            identifiers.append(conn['id'])
-            identifiers.append(conn['uuid'])
-        return identifiers
+        """Returns a sorted list of all connection IDs and UUIDs for completion."""
+        self._get_all_settings()
+        # completion asks on every Tab press, keep the list until the profiles change
+        if self._ids_cache is None:
+            self._ids_cache = sorted(self._by_key)
+        return self._ids_cache
+
+    def _collect_device_info(self, dev_path: str,
+                             objects: Optional[Dict[str, Dict[str, Dict[str, Any]]]]
+                             ) -> Dict[str, Any]:
+        """ Gathers what list_devices shows about one device """
+        all_props = self._get_all_props(dev_path, 'org.freedesktop.NetworkManager.Device',
+                                        objects)
+
+        iface = all_props['Interface']
+        dev_type_num = all_props['DeviceType']
+        # WORKAROUND: Corrects known DeviceType bugs from certain NetworkManager versions.
+        if dev_type_num == 13 and 'br' in iface:
+            logging.debug(
+                        "Applying workaround: Correcting device type for %s from 13 to 5.",
+                        iface
+                        )
+            dev_type_num = 5
+        elif dev_type_num == 30 and iface.startswith('p2p-dev-'):
+            logging.debug(
+                "Applying workaround: Correcting device type for %s from 30 to 28.",
+                iface
+                )
+            dev_type_num = 28
+        dev_state_num = all_props['State']
+
+        # the active connection carries the profile name, no need to fetch its settings
+        conn_name = "---"
+        active_conn_path = all_props['ActiveConnection']
+        if active_conn_path != "/":
+            conn_name = self._get_all_props(active_conn_path,
+                                            'org.freedesktop.NetworkManager.Connection.Active',
+                                            objects)['Id']
+
+        if 0 <= dev_type_num < len(DEV_TYPES):
+            dev_type_str = DEV_TYPES[dev_type_num]
+        else:
+            dev_type_str = f"Unknown ({dev_type_num})"
+        if dev_state_num % 10 == 0 and 0 < dev_state_num // 10 <= len(DEV_STATES):
+            dev_state_str = DEV_STATES[dev_state_num // 10 - 1]
+        else:
+            dev_state_str = f"Unknown ({dev_state_num})"
+        return {
+            'iface': iface,
+            'type': dev_type_str,
+            'mac': all_props.get('HwAddress', '---'),
+            'state': dev_state_str,
+            'conn_name': conn_name,
+            'autoconnect': "Yes" if all_props['Autoconnect'] else "No",
+        }
 
     def list_devices(self) -> None:
         """
@@ -624,85 +927,24 @@ class NMManager:
         logging.debug("list_devices")
         logging.info("Querying for available devices...")
         try:
-            devices_paths = self.nm_interface.GetAllDevices()
+            devices_paths = self._get_device_paths()
             if not devices_paths:
                 logging.error("No network devices found.")
                 return
 
-            print(
+            rows = [
                 f"{'INTERFACE':<15} "
                 f"{'DEV TYPE':<12} "
                 f"{'MAC ADDRESS':<20} "
                 f"{'STATE':<15} "
                 f"{'CONNECTION':<18} "
-                f"{'AUTOCONNECT':<10}"
-                )
-            print("=" * 105)
-
+                f"{'AUTOCONNECT':<10}",
+                "=" * 105,
+            ]
+            objects = self._get_managed_objects()
             for dev_path in devices_paths:
-                dev_proxy = self.bus.get_object('org.freedesktop.NetworkManager', dev_path)
-                prop_interface = dbus.Interface(dev_proxy, 'org.freedesktop.DBus.Properties')
-                all_props = prop_interface.GetAll('org.freedesktop.NetworkManager.Device')
-
-                iface = all_props['Interface']
-                autoconnect_bool = all_props['Autoconnect']
-                autoconnect_str = "Yes" if autoconnect_bool else "No"
-                dev_type_num = all_props['DeviceType']
-                # WORKAROUND: Corrects known DeviceType bugs from certain NetworkManager versions.
-                if dev_type_num == 13 and ('br' in iface or 'virbr' in iface):
-                    logging.debug(
-                                "Applying workaround: Correcting device type for %s from 13 to 5.",
-                                iface
-                                )
-                    dev_type_num = 5
-                elif dev_type_num == 30 and iface.startswith('p2p-dev-'):
-                    logging.debug(
-                        "Applying workaround: Correcting device type for %s from 30 to 28.",
-                        iface
-                        )
-                    dev_type_num = 28
-                dev_state_num = all_props['State']
-                mac_address = all_props.get('HwAddress', '---')
-
-                active_conn_path = prop_interface.Get(
-                                                'org.freedesktop.NetworkManager.Device',
-                                                'ActiveConnection'
-                                                )
-                conn_name = "---"
-                if active_conn_path != "/":
-                    ac_proxy = self.bus.get_object(
-                                                'org.freedesktop.NetworkManager',
-                                                active_conn_path
-                                                )
-                    ac_props_iface = dbus.Interface(
-                                                ac_proxy,
-                                                'org.freedesktop.DBus.Properties'
-                                                )
-                    conn_settings_path = ac_props_iface.Get(
-                                            'org.freedesktop.NetworkManager.Connection.Active',
-                                            'Connection'
-                                            )
-
-                    settings_proxy = self.bus.get_object(
-                                                    'org.freedesktop.NetworkManager',
-                                                    conn_settings_path
-                                                    )
-                    settings_iface = dbus.Interface(
-                                            settings_proxy,
-                                            'org.freedesktop.NetworkManager.Settings.Connection'
-                                            )
-                    settings = settings_iface.GetSettings()
-                    conn_name = settings['connection']['id']
-                dev_type_str = DEV_TYPES.get(dev_type_num, f"Unknown ({dev_type_num})")
-                dev_state_str = DEV_STATES.get(dev_state_num, f"Unknown ({dev_state_num})")
-                print(
-                    f"{iface:<15} "
-                    f"{dev_type_str:<12} "
-                    f"{mac_address:<20} "
-                    f"{dev_state_str:<15} "
-                    f"{conn_name:<18} "
-                    f"{autoconnect_str:<12}"
-                    )
+                rows.append(DEV_ROW_FMT(self._collect_device_info(dev_path, objects)))
+            print('\n'.join(rows))
 
         except dbus.exceptions.DBusException as err:
             logging.error("Error getting devices: %s", err)
@@ -713,22 +955,32 @@ class InteractiveShell(cmd.Cmd):
     intro += "Type `help` or `?` to list commands.\n"
     promptline = '_________________________________________\n'
     prompt = promptline + "virt-bridge #> "
+    # completion data for the 'add' command
+    _ADD_OPTIONS = (
+        '--conn-name', '--bridge-ifname', '--slave-interface', '--stp',
+        '--fdelay', '--stp-priority', '--no-clone-mac', '--multicast-snooping',
+        '--vlan-filtering', '--vlan-default-pvid'
+    )
+    _YESNO = ('yes', 'no')
+    _SLAVE_FLAGS = frozenset({'--slave-interface'})
+    _YN_FLAGS = frozenset({'--stp', '--multicast-snooping', '--vlan-filtering'})
 
     def __init__(self, manager: 'NMManager') -> None:
         super().__init__()
         self.manager = manager
         try:
+            # only the interactive shell needs readline, don't load it for one-shot commands
+            import readline  # pylint: disable=import-outside-toplevel
             delims = readline.get_completer_delims()
             delims = delims.replace('-', '')
             readline.set_completer_delims(delims)
         except ImportError:
             pass
+        self._add_parser = self._build_add_parser()
 
-    def do_add(self, arg_string: str) -> None:
-        """
-        Adds a new bridge connection with specified options
-        """
-        logging.debug("do_add %s", arg_string)
+    @staticmethod
+    def _build_add_parser() -> argparse.ArgumentParser:
+        """ Builds the parser of the add command, once for the whole session """
         parser = argparse.ArgumentParser(prog='add', description='Add a new bridge connection.')
         parser.add_argument('--conn-name', dest='conn_name', help=help_data['help_conn_name'],
                             default=DEFAULT_BRIDGE_CONN_NAME)
@@ -750,8 +1002,15 @@ class InteractiveShell(cmd.Cmd):
                             default='no', dest='vlan_filtering', help=help_data['vlan_filtering'])
         parser.add_argument('--vlan-default-pvid', type=int, default=None,
                     dest='vlan_default_pvid', help=help_data['vlan_default_pvid'])
+        return parser
+
+    def do_add(self, arg_string: str) -> None:
+        """
+        Adds a new bridge connection with specified options
+        """
+        logging.debug("do_add %s", arg_string)
         try:
-            args = parser.parse_args(arg_string.split())
+            args = self._add_parser.parse_args(arg_string.split())
         except SystemExit:
             return
 
@@ -762,21 +1021,11 @@ class InteractiveShell(cmd.Cmd):
                 print("Error: Could not find a suitable default slave interface.")
                 return
 
-        bridge_config = {
-            'conn_name': args.conn_name,
-            'bridge_ifname': args.bridge_ifname,
-            'slave_interface': args.slave_interface,
-            'clone_mac': args.clone_mac,
-            'stp': args.stp,
-            'forward_delay': args.forward_delay,
-            'stp_priority': args.stp_priority,
-            'multicast_snooping': args.multicast_snooping,
-            'vlan_filtering': args.vlan_filtering,
-            'vlan_default_pvid': args.vlan_default_pvid,
-        }
-        self.manager.add_bridge_connection(bridge_config)
-        slave_conn_name = f"{args.conn_name}-port-{args.slave_interface}"
-        self.manager.activate_connection(slave_conn_name)
+        # the parser's dests are exactly the bridge config keys
+        slave_path = self.manager.add_bridge_connection(vars(args))
+        if slave_path:
+            slave_conn_name = f"{args.conn_name}-port-{args.slave_interface}"
+            self.manager.activate_connection(slave_conn_name, conn_path=slave_path)
 
     def complete_add(self, text: str, line: str, begidx: int, _endidx: int) -> List[str]:
         """ Provides context-aware auto-completion for the 'add' command """
@@ -784,18 +1033,13 @@ class InteractiveShell(cmd.Cmd):
         if not words_before_cursor:
             return []
         last_full_word = words_before_cursor[-1]
-        if last_full_word in ['--slave-interface']:
+        if last_full_word in self._SLAVE_FLAGS:
             candidates = self.manager.get_slave_candidates()
             return [c for c in candidates if c.startswith(text)]
-        if last_full_word in [ '--stp', '--multicast-snooping', '--vlan-filtering']:
-            return [s for s in ['yes', 'no'] if s.startswith(text)]
+        if last_full_word in self._YN_FLAGS:
+            return [s for s in self._YESNO if s.startswith(text)]
 
-        options = [
-            '--conn-name', '--bridge-ifname', '--slave-interface', '--stp', 
-            '--fdelay', '--stp-priority', '--no-clone-mac', '--multicast-snooping',
-            '--vlan-filtering', '--vlan-default-pvid'
-        ]
-        return [opt for opt in options if opt.startswith(text)]
+        return [opt for opt in self._ADD_OPTIONS if opt.startswith(text)]
 
     def do_list_devices(self, _: str) -> None:
         """ List all available network devices. Alias: dev """
@@ -835,6 +1079,15 @@ class InteractiveShell(cmd.Cmd):
         dry_run = '--dry-run' in args
         return name_or_uuid, dry_run
 
+    def _complete_identifier(self, text: str) -> List[str]:
+        """ Returns the connection names/UUIDs starting with text """
+        ids = self.manager.get_all_connection_identifiers()
+        # the list is sorted: matches form one run starting at the bisection point
+        start = end = bisect.bisect_left(ids, text)
+        while end < len(ids) and ids[end].startswith(text):
+            end += 1
+        return ids[start:end]
+
     def do_delete(self, arg: str) -> None:
         """
         Delete a connection by name or UUID.
@@ -847,7 +1100,7 @@ class InteractiveShell(cmd.Cmd):
 
     def complete_delete(self, text: str, _line: str, _begidx: str, _endidx: str) -> List[str]:
         """ complete delete command """
-        return [i for i in self.manager.get_all_connection_identifiers() if i.startswith(text)]
+        return self._complete_identifier(text)
 
     def do_activate(self, arg: str) -> None:
         """ Activate a connection by name or UUID. Usage: activate <name|uuid> """
@@ -858,7 +1111,7 @@ class InteractiveShell(cmd.Cmd):
 
     def complete_activate(self, text: str, _line: str, _begidx: str, _endidx: str) -> List[str]:
         """ Complete activation """
-        return [i for i in self.manager.get_all_connection_identifiers() if i.startswith(text)]
+        return self._complete_identifier(text)
 
     def do_deactivate(self, arg: str) -> None:
         """ Deactivate a connection by name or UUID. Usage: activate <name|uuid> """
@@ -869,7 +1122,7 @@ class InteractiveShell(cmd.Cmd):
 
     def complete_deactivate(self, text: str, _line: str, _begidx: str, _endidx: str) -> List[str]:
         """ Complete deactivation """
-        return [i for i in self.manager.get_all_connection_identifiers() if i.startswith(text)]
+        return self._complete_identifier(text)
 
     def do_exit(self, _: str) -> bool:
         """ Exit the interactive shell. Alias: quit """
@@ -896,10 +1149,60 @@ help_data = {
 
 def main():
     """ The main function """
-    manager = NMManager()
+    # the handlers run once the manager below exists;
+    # only add and showb look at the existing bridges, don't enumerate them for the rest
+    def handle_add_bridge(args):
+        # with --force the existing bridges don't matter, don't even look for them
+        if not args.force:
+            found_bridges = manager.find_existing_bridges()
+            if found_bridges:
+                logging.info(
+                    "There is already some bridges on this system\n"
+                    "use --force option to create another one"
+                )
+                manager.show_existing_bridges(found_bridges)
+                sys.exit(1)
+        if not args.slave_interface:
+            args.slave_interface = manager.select_default_slave_interface()
+        if not manager.check_interface_exist(args.slave_interface):
+            logging.error("No interface: %s", args.slave_interface)
+            manager.list_devices()
+            sys.exit(1)
+        slave_path = manager.add_bridge_connection(vars(args))
+        if slave_path:
+            slave_conn_name = f"{args.conn_name}-port-{args.slave_interface}"
+            manager.activate_connection(slave_conn_name, conn_path=slave_path)
+
+    def handle_interactive(_):
+        InteractiveShell(manager).cmdloop()
+        sys.exit(0)
+
+    def handle_dev(_):
+        manager.list_devices()
+
+    def handle_conn(_):
+        manager.list_connections()
+
+    def handle_delete(args):
+        manager.delete_connection(args.name, True, args.dry_run)
+
+    def handle_activate(args):
+        manager.activate_connection(args.name, args.dry_run)
+
+    def handle_deactivate(args):
+        manager.deactivate_connection(args.name, args.dry_run)
+
+    def handle_showb(_):
+        found_bridges = manager.find_existing_bridges()
+        if not found_bridges:
+            logging.info("No existing bridge connections found.")
+        else:
+            manager.show_existing_bridges(found_bridges)
+
     parser = argparse.ArgumentParser(description="Manage Bridge connections.")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     parser_add_bridge = subparsers.add_parser('add', help='Add a new bridge connection.')
+    parser_add_bridge.set_defaults(func=handle_add_bridge)
     parser_add_bridge.add_argument(
         '-cn',
         '--conn-name',
@@ -974,10 +1277,15 @@ def main():
         dest='vlan_default_pvid',
         help=help_data['vlan_default_pvid']
     )
-    subparsers.add_parser('dev', help='Show all available network devices.')
-    subparsers.add_parser('conn', help='Show all connections.')
-    subparsers.add_parser('showb', help='Show all current bridges.')
-    subparsers.add_parser('interactive', help='Start an interactive shell session.')
+    parser_dev = subparsers.add_parser('dev', help='Show all available network devices.')
+    parser_dev.set_defaults(func=handle_dev)
+    parser_conn = subparsers.add_parser('conn', help='Show all connections.')
+    parser_conn.set_defaults(func=handle_conn)
+    parser_showb = subparsers.add_parser('showb', help='Show all current bridges.')
+    parser_showb.set_defaults(func=handle_showb)
+    parser_interactive = subparsers.add_parser('interactive',
+                                               help='Start an interactive shell session.')
+    parser_interactive.set_defaults(func=handle_interactive)
     parser.add_argument('-f', '--force', action='store_true',
                         help='Force adding a bridge (even if one exist already)'
                         )
@@ -985,14 +1293,17 @@ def main():
                         action='store_true', help='Dont do anything')
     parser_delete = subparsers.add_parser('delete', help='Delete a connection.')
     parser_delete.add_argument('name', help='The name (ID) or UUID of the connection to delete.')
+    parser_delete.set_defaults(func=handle_delete)
     parser_activate = subparsers.add_parser('activate', help='Activate a connection.')
     parser_activate.add_argument('name',
                                 help='The name (ID) or UUID of the connection to activate.'
                                 )
+    parser_activate.set_defaults(func=handle_activate)
     parser_deactivate = subparsers.add_parser('deactivate', help='Deactivate a connection.')
     parser_deactivate.add_argument('name',
                                     help='The name (ID) or UUID of the connection to deactivate.'
                                     )
+    parser_deactivate.set_defaults(func=handle_deactivate)
     parser.add_argument('-d', '--debug',
                         action='store_true',
                         help='Enable debug mode (very verbose...)'
@@ -1008,66 +1319,17 @@ def main():
     else:
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-    found_bridges = manager.find_existing_bridges()
-
-    def handle_add_bridge(args):
-        if found_bridges and not args.force:
-            logging.info(
-                "There is already some bridges on this system\n"
-                "use --force option to create another one"
-            )
-            manager.show_existing_bridges(found_bridges)
-            sys.exit(1)
-        else:
-            if not args.slave_interface:
-                args.slave_interface = manager.select_default_slave_interface()
-            if not manager.check_interface_exist(args.slave_interface):
-                logging.error("No interface: %s", args.slave_interface)
-                manager.list_devices()
-                sys.exit(1)
-            manager.add_bridge_connection(vars(args))
-            slave_conn_name = f"{args.conn_name}-port-{args.slave_interface}"
-            if not args.dry_run:
-                manager.activate_connection(slave_conn_name)
-
-    def handle_interactive(_):
-        InteractiveShell(manager).cmdloop()
-        sys.exit(0)
-
-    def handle_dev(_):
-        manager.list_devices()
-
-    def handle_conn(_):
-        manager.list_connections()
-
-    def handle_delete(args):
-        manager.delete_connection(args.name, True, args.dry_run)
-
-    def handle_activate(args):
-        manager.activate_connection(args.name, args.dry_run)
-
-    def handle_deactivate(args):
-        manager.deactivate_connection(args.name, args.dry_run)
-
-    def handle_showb(_):
-        if not found_bridges:
-            logging.info("No existing bridge connections found.")
-        else:
-            manager.show_existing_bridges(found_bridges)
+    # the interactive shell lives long and keeps the shared bus
+    if args.command == 'interactive':
+        manager = NMManager()
+    else:
+        manager = NMManager.oneshot()
 
-    command_handlers = {
-        'add': handle_add_bridge,
-        'interactive': handle_interactive,
-        'dev': handle_dev,
-        'conn': handle_conn,
-        'delete': handle_delete,
-        'activate': handle_activate,
-        'deactivate': handle_deactivate,
-        'showb': handle_showb,
-    }
-
-    if args.command in command_handlers:
-        command_handlers[args.command](args)
+    try:
+        if hasattr(args, 'func'):
+            args.func(args)
+    finally:
+        manager.close()
 
 if __name__ == "__main__":
     if sys.version_info[0] < 3:
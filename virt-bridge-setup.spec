@@ -26,6 +26,7 @@ Source0:        https://github.com/aginies/virt-bridge-setup/releases/download/%
 BuildArch:      noarch
 Requires:       NetworkManager
 Requires: 	python3-dbus-python
+Requires: 	python3-gobject
 BuildRequires:       make
 
 %description